@@ -1,14 +1,21 @@
 """Client module for ttrsscli."""
 
 import logging
+from operator import attrgetter
+from time import monotonic
 from typing import Any
 
 from ttrss.client import Article, Category, Feed, Headline, TTRClient
 
+from .cache import LimitedSizeDict
 from .utils.decorators import handle_session_expiration
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Headline lists kept for recently viewed feeds and categories, older ones are
+# dropped and fetched again when revisited
+HEADLINE_CACHE_SIZE: int = 4
+
 
 class TTRSSClient:
     """A wrapper for ttrss-python to reauthenticate on failure and provide caching."""
@@ -22,7 +29,10 @@ class TTRSSClient:
             url=self.url, user=self.username, password=self.password, auto_login=False
         )
         self.cache = {}  # Simple cache to reduce API calls
+        self.headline_cache = LimitedSizeDict(max_size=HEADLINE_CACHE_SIZE)
         self._authenticated = False
+        # When the last successful login happened, see handle_session_expiration
+        self.last_login: float = 0.0
 
     def login(self) -> bool:
         """Authenticate with TTRSS and store session.
@@ -53,6 +63,7 @@ class TTRSSClient:
 
             logger.info(msg="Successfully authenticated with TTRSS")
             self._authenticated = True
+            self.last_login = monotonic()
             return True
         except Exception as e:
             logger.error(msg=f"Login failed: {type(e).__name__}: {e}")
@@ -79,9 +90,13 @@ class TTRSSClient:
         self.cache[cache_key] = articles
         return articles
 
+    def has_article(self, article_id) -> bool:
+        """Check if an article is cached, so fetching it needs no request."""
+        return f"article_{article_id}" in self.cache
+
     @handle_session_expiration
     def get_categories(self) -> list[Category]:
-        """Fetch category list, retrying if session expires."""
+        """Fetch category list sorted by title, retrying if session expires."""
         cache_key = "categories"
         if cache_key in self.cache:
             return self.cache[cache_key]
@@ -91,6 +106,8 @@ class TTRSSClient:
         except Exception as e:
             logger.error(msg=f"Error fetching categories: {type(e).__name__}: {e}")
             return []
+        # Sort once here, callers reuse the cached list until it's invalidated
+        categories.sort(key=attrgetter("title"))
         self.cache[cache_key] = categories
         return categories
 
@@ -115,8 +132,14 @@ class TTRSSClient:
     def get_headlines(self, feed_id, is_cat, view_mode) -> list[Headline]:
         """Fetch headlines for a feed, retrying if session expires."""
         cache_key: str = f"headlines_{feed_id}_{is_cat}_{view_mode}"
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        # mark_read can clear the cache from a worker thread at any point, a
+        # missing key just means the cached headlines were invalidated
+        try:
+            cached: list[Headline] = self.headline_cache[cache_key]
+            self.headline_cache.move_to_end(key=cache_key)
+            return cached
+        except KeyError:
+            pass
 
         try:
             headlines: list[Headline] = self.api.get_headlines(
@@ -127,7 +150,7 @@ class TTRSSClient:
                 msg=f"Error fetching headlines for feed {feed_id}: {type(e).__name__}: {e}"
             )
             return []
-        self.cache[cache_key] = headlines
+        self.headline_cache[cache_key] = headlines
         return headlines
 
     @handle_session_expiration
@@ -135,6 +158,9 @@ class TTRSSClient:
         """Mark article as read, retrying if session expires."""
         try:
             self.api.mark_read(article_ids=article_id)
+            # Keep the cached copy in step so the article isn't marked again
+            for article in self.cache.get(f"article_{article_id}", []):
+                article.unread = False
         except Exception as e:
             logger.error(msg=f"Error marking article {article_id} as read: {e}")
         # Invalidate relevant cache entries
@@ -254,7 +280,7 @@ class TTRSSClient:
                             # Add the feed_url attribute to feed_props
                             feed_props.feed_url = feed_url  # type: ignore
                 except Exception as e:
-                    logger.debug(msg=f"Error retrieving feed URL from tree: {e}")
+                    logger.debug("Error retrieving feed URL from tree: %s", e)
 
             # Cache the result
             self.cache[cache_key] = feed_props
@@ -317,7 +343,7 @@ class TTRSSClient:
                                         feed_props.feed_url = feed_url  # type: ignore
                             except Exception as e:
                                 logger.debug(
-                                    msg=f"Error retrieving feed URL from tree: {e}"
+                                    "Error retrieving feed URL from tree: %s", e
                                 )
 
                         # Cache the result
@@ -363,21 +389,21 @@ class TTRSSClient:
 
     def _invalidate_headline_cache(self) -> None:
         """Invalidate all headline cache entries."""
-        keys_to_remove: list[str] = [
-            k for k in self.cache if k.startswith("headlines_")
-        ]
-        for key in keys_to_remove:
-            del self.cache[key]
+        self.headline_cache.clear()
 
         # Also invalidate categories cache as unread counts may have changed
         if "categories" in self.cache:
             del self.cache["categories"]
 
-        # Also invalidate feeds cache as unread counts may have changed
-        keys_to_remove = [k for k in self.cache if k.startswith("feeds_")]
+        # Also invalidate feeds cache as unread counts may have changed, iterate
+        # over a copy since prefetch threads may add articles meanwhile
+        keys_to_remove: list[str] = [
+            k for k in list(self.cache) if k.startswith("feeds_")
+        ]
         for key in keys_to_remove:
             del self.cache[key]
 
     def clear_cache(self) -> None:
         """Clear the entire cache."""
         self.cache.clear()
+        self.headline_cache.clear()
@@ -7,14 +7,16 @@ import logging
 import os
 import subprocess
 import sys
+import tomllib
 from importlib import metadata
 from pathlib import Path
 from typing import Any
 
-import toml
-
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Longest wait for a 1Password CLI call, generous as op may be waiting for the
+# user to unlock 1Password
+OP_TIMEOUT_SECONDS: float = 60
 
 # Default configuration content
 DEFAULT_CONFIG = """[general]
@@ -135,6 +137,7 @@ def optimize_op_commands(config_dict: dict[str, Any]) -> dict[str, str]:  # noqa
                 capture_output=True,
                 text=True,
                 check=True,
+                timeout=OP_TIMEOUT_SECONDS,
             )
             return item_id, fields, json.loads(result.stdout)
 
@@ -172,6 +175,7 @@ def optimize_op_commands(config_dict: dict[str, Any]) -> dict[str, str]:  # noqa
                                     capture_output=True,
                                     text=True,
                                     check=True,
+                                    timeout=OP_TIMEOUT_SECONDS,
                                 )
                                 processed_op_values[key] = (
                                     fallback_result.stdout.strip()
@@ -183,10 +187,11 @@ def optimize_op_commands(config_dict: dict[str, Any]) -> dict[str, str]:  # noqa
                                 capture_output=True,
                                 text=True,
                                 check=True,
+                                timeout=OP_TIMEOUT_SECONDS,
                             )
                             processed_op_values[key] = fallback_result.stdout.strip()
 
-                except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
+                except (subprocess.SubprocessError, json.JSONDecodeError, KeyError):
                     # If optimized approach fails, fall back to individual commands
                     item_id = item_futures[future]
                     fields = item_groups[item_id]
@@ -197,9 +202,10 @@ def optimize_op_commands(config_dict: dict[str, Any]) -> dict[str, str]:  # noqa
                                 capture_output=True,
                                 text=True,
                                 check=True,
+                                timeout=OP_TIMEOUT_SECONDS,
                             )
                             processed_op_values[key] = result.stdout.strip()
-                        except subprocess.CalledProcessError as err:
+                        except subprocess.SubprocessError as err:
                             logger.error(
                                 msg=f"Error executing command '{field_info['command']}': {err}"
                             )
@@ -210,26 +216,34 @@ def optimize_op_commands(config_dict: dict[str, Any]) -> dict[str, str]:  # noqa
 
     # Process individual commands in parallel using ThreadPoolExecutor
     if individual_commands:
+        # The same command (one secret used for several keys) only runs once
+        keys_by_command: dict[str, list[str]] = {}
+        for key, op_command in individual_commands.items():
+            keys_by_command.setdefault(op_command, []).append(key)
 
-        def run_op_command(key_command_tuple):
-            key, op_command = key_command_tuple
+        def run_op_command(op_command):
             result = subprocess.run(
-                op_command.split(), capture_output=True, text=True, check=True
+                op_command.split(),
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=OP_TIMEOUT_SECONDS,
             )
-            return key, result.stdout.strip()
+            return op_command, result.stdout.strip()
 
         # Run commands in parallel
         with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_key = {
-                executor.submit(run_op_command, (key, cmd)): key
-                for key, cmd in individual_commands.items()
-            }
+            futures = [
+                executor.submit(run_op_command, op_command)
+                for op_command in keys_by_command
+            ]
 
-            for future in concurrent.futures.as_completed(future_to_key):
+            for future in concurrent.futures.as_completed(futures):
                 try:
-                    key, value = future.result()
-                    processed_op_values[key] = value
-                except subprocess.CalledProcessError as err:
+                    op_command, value = future.result()
+                    for key in keys_by_command[op_command]:
+                        processed_op_values[key] = value
+                except subprocess.SubprocessError as err:
                     logger.error(msg=f"Error executing 1Password command: {err}")
                     print(f"Error executing 1Password command: {err}")
                     sys.exit(1)
@@ -390,37 +404,19 @@ class Configuration:
         self.config: dict[str, Any] = self.load_config_file(config_file=args.config)
 
         try:
-            # Optimize TTRSS credentials for faster startup
-            ttrss_config_raw = {
+            general_config = self.config.get("general", {})
+            readwise_config = self.config.get("readwise", {})
+            obsidian_config = self.config.get("obsidian", {})
+
+            # Resolve every value in one batch so 1Password commands for the
+            # same item are fetched once and all lookups run in parallel
+            config_raw = {
                 "api_url": self.config["ttrss"].get("api_url", ""),
                 "username": self.config["ttrss"].get("username", ""),
                 "password": self.config["ttrss"].get("password", ""),
-            }
-            ttrss_processed = optimize_op_commands(ttrss_config_raw)
-
-            self.api_url: str = ttrss_processed["api_url"]
-            self.username: str = ttrss_processed["username"]
-            self.password: str = ttrss_processed["password"]
-
-            # Get general settings with defaults
-            general_config = self.config.get("general", {})
-            general_config_raw = {
                 "download_folder": general_config.get(
                     "download_folder", os.path.expanduser(path="~/Downloads")
-                )
-            }
-            general_processed = optimize_op_commands(general_config_raw)
-
-            self.download_folder: Path = Path(general_processed["download_folder"])
-            self.auto_mark_read: bool = general_config.get("auto_mark_read", True)
-            self.cache_size: int = general_config.get("cache_size", 10000)
-            self.default_theme: str = general_config.get("default_theme", "dark")
-
-            # Batch process all other optional settings
-            readwise_config = self.config.get("readwise", {})
-            obsidian_config = self.config.get("obsidian", {})
-
-            optional_config_raw = {
+                ),
                 "readwise_token": readwise_config.get("token", ""),
                 "obsidian_directory": obsidian_config.get("directory", ""),
                 "obsidian_vault": obsidian_config.get("vault", ""),
@@ -428,23 +424,34 @@ class Configuration:
                 "obsidian_default_tag": obsidian_config.get("default_tag", ""),
                 "obsidian_template": obsidian_config.get("template", ""),
             }
-            optional_processed = optimize_op_commands(optional_config_raw)
+            processed = optimize_op_commands(config_raw)
+
+            # Get TTRSS credentials
+            self.api_url: str = processed["api_url"]
+            self.username: str = processed["username"]
+            self.password: str = processed["password"]
+
+            # Get general settings with defaults
+            self.download_folder: Path = Path(processed["download_folder"])
+            self.auto_mark_read: bool = general_config.get("auto_mark_read", True)
+            self.cache_size: int = general_config.get("cache_size", 10000)
+            self.default_theme: str = general_config.get("default_theme", "dark")
 
             # Get readwise settings
-            self.readwise_token: str = optional_processed["readwise_token"]
+            self.readwise_token: str = processed["readwise_token"]
 
             # Get obsidian settings
-            self.obsidian_directory: str = optional_processed["obsidian_directory"]
-            self.obsidian_vault: str = optional_processed["obsidian_vault"]
-            self.obsidian_folder: str = optional_processed["obsidian_folder"]
-            self.obsidian_default_tag: str = optional_processed["obsidian_default_tag"]
+            self.obsidian_directory: str = processed["obsidian_directory"]
+            self.obsidian_vault: str = processed["obsidian_vault"]
+            self.obsidian_folder: str = processed["obsidian_folder"]
+            self.obsidian_default_tag: str = processed["obsidian_default_tag"]
             self.obsidian_include_tags: bool = obsidian_config.get(
                 "include_tags", False
             )
             self.obsidian_include_labels: bool = obsidian_config.get(
                 "include_labels", True
             )
-            self.obsidian_template: str = optional_processed["obsidian_template"]
+            self.obsidian_template: str = processed["obsidian_template"]
 
             # Make sure download folder exists
             self.download_folder.mkdir(parents=True, exist_ok=True)
@@ -481,8 +488,8 @@ class Configuration:
                 )
                 sys.exit(1)
 
-            return toml.loads(s=config_path.read_text())
-        except (FileNotFoundError, toml.TomlDecodeError) as err:
+            return tomllib.loads(config_path.read_text())
+        except (FileNotFoundError, tomllib.TOMLDecodeError) as err:
             logger.error(msg=f"Error reading configuration file: {err}")
             print(f"Error reading configuration file: {err}")
             sys.exit(1)
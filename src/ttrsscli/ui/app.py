@@ -9,12 +9,12 @@ import subprocess
 import sys
 import webbrowser
 from datetime import datetime
+from functools import partial
 from pathlib import Path, PurePath
 from time import sleep
 from typing import Any, ClassVar, Final, Literal
 from urllib.parse import quote
 
-import httpx
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -22,6 +22,7 @@ from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Footer, Header, ListItem, ListView, Static
 from ttrss.client import Article
@@ -49,10 +50,13 @@ from .screens import (
     ProgressScreen,
     SearchScreen,
 )
-from .widgets import LinkableMarkdownViewer
+from .widgets import LinkableMarkdownViewer, ListRow
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Delay before the articles of a highlighted category or feed are loaded
+ARTICLES_DEBOUNCE_SECONDS: float = 0.08
+
 
 class ttrsscli(App[None]):
     """A Textual app to access and read articles from Tiny Tiny RSS."""
@@ -161,6 +165,10 @@ class ttrsscli(App[None]):
         self.group_feeds: bool = True
         self.is_loading: bool = False
         self.last_key: str = ""
+        self._articles_timer: Timer | None = None
+        self.list_update_lock: asyncio.Lock = asyncio.Lock()
+        # Bumped by each refresh so one that was overtaken drops its results
+        self.refresh_generation: dict[str, int] = {"articles": 0, "categories": 0}
         self.selected_article_ids: set[int] = set()  # Track which articles are selected
         self.show_header: bool = False
         self.show_unread_only = reactive(default=True)
@@ -170,9 +178,6 @@ class ttrsscli(App[None]):
         )  # Use default, will be updated when config loads
         self.temp_files: list[Path] = []  # List of temporary files to clean up on exit
 
-        # Create httpx client for downloads
-        self.http_client = httpx.Client(follow_redirects=True)
-
     @property
     def configuration(self):
         """Lazy load configuration when first accessed."""
@@ -223,8 +228,9 @@ class ttrsscli(App[None]):
 
     async def on_ready(self) -> None:
         """UI is ready, start background connection process."""
-        # Use a timer to defer connection until after UI renders
-        self.set_timer(0.1, self.start_connection)
+        # Ready is only sent after the first frame has been displayed, so the
+        # connection can start right away without delaying the layout
+        self.start_connection()
 
     def start_connection(self) -> None:
         """Start the connection process in background."""
@@ -321,57 +327,72 @@ class ttrsscli(App[None]):
             return
 
         highlighted_item: Any = message.item  # type: ignore
+        item_id: str | None = getattr(highlighted_item, "id", None)
+        if item_id is None:
+            return
+
+        # Item ids are "<kind>_<id>", split once rather than testing each prefix
+        kind, _, value = item_id.partition("_")
         try:
-            if highlighted_item is not None:
-                # Handle category selection -> refresh articles
-                if (
-                    hasattr(highlighted_item, "id")
-                    and highlighted_item.id is not None
-                    and highlighted_item.id.startswith("cat_")
+            # Handle category selection -> refresh articles
+            if kind == "cat":
+                self.category_id = item_id
+                self._schedule_refresh_articles(show_id=int(value))
+                # Update category index position for navigation
+                if hasattr(highlighted_item, "parent") and hasattr(
+                    highlighted_item.parent, "index"
                 ):
-                    category_id = int(highlighted_item.id.replace("cat_", ""))
-                    self.category_id = highlighted_item.id
-                    await self.refresh_articles(show_id=category_id)
-                    # Update category index position for navigation
-                    if hasattr(highlighted_item, "parent") and hasattr(
-                        highlighted_item.parent, "index"
-                    ):
-                        self.category_index = highlighted_item.parent.index
+                    self.category_index = highlighted_item.parent.index
+
+            # Handle feed selection in expanded category view -> refresh articles
+            elif kind == "feed":
+                self.category_id = item_id
+                self._schedule_refresh_articles(show_id=item_id)
+
+            # Handle feed title selection in article list -> navigate articles
+            elif kind == "ft":
+                if self.last_key == "j":
+                    self.action_next_article()
+                elif self.last_key == "k":
+                    if highlighted_item.parent.index == 0:
+                        self.action_next_article()
+                    else:
+                        self.action_previous_article()
+
+            # Handle article selection -> display selected article content
+            elif kind == "art":
+                article_id = int(value)
+                self.article_id = article_id
+                highlighted_item.styles.text_style = "none"
+                self.selected_article_ids.add(article_id)
+                await self.display_article_content(article_id=article_id)
+        except Exception as err:
+            log_and_notify(self, err, "Error")
 
-                # Handle feed selection in expanded category view -> refresh articles
-                elif (
-                    hasattr(highlighted_item, "id")
-                    and highlighted_item.id is not None
-                    and highlighted_item.id.startswith("feed_")
-                ):
-                    self.category_id = highlighted_item.id
-                    await self.refresh_articles(show_id=highlighted_item.id)
+    def _schedule_refresh_articles(self, show_id: int | str) -> None:
+        """Load articles for a highlighted category or feed once the cursor settles.
 
-                # Handle feed title selection in article list -> navigate articles
-                elif (
-                    hasattr(highlighted_item, "id")
-                    and highlighted_item.id is not None
-                    and highlighted_item.id.startswith("ft_")
-                ):
-                    if self.last_key == "j":
-                        self.action_next_article()
-                    elif self.last_key == "k":
-                        if highlighted_item.parent.index == 0:
-                            self.action_next_article()
-                        else:
-                            self.action_previous_article()
+        Holding j/k moves through many entries, only the last one is fetched.
 
-                # Handle article selection -> display selected article content
-                elif (
-                    hasattr(highlighted_item, "id")
-                    and highlighted_item.id is not None
-                    and highlighted_item.id.startswith("art_")
-                ):
-                    article_id = int(highlighted_item.id.replace("art_", ""))
-                    self.article_id = article_id
-                    highlighted_item.styles.text_style = "none"
-                    self.selected_article_ids.add(article_id)
-                    await self.display_article_content(article_id=article_id)
+        Args:
+            show_id: ID of category or feed to show articles for
+        """
+        if self._articles_timer is not None:
+            self._articles_timer.stop()
+        self._articles_timer = self.set_timer(
+            ARTICLES_DEBOUNCE_SECONDS,
+            partial(self._refresh_highlighted_articles, show_id),
+        )
+
+    async def _refresh_highlighted_articles(self, show_id: int | str) -> None:
+        """Load articles for the category or feed that was highlighted last.
+
+        Args:
+            show_id: ID of category or feed to show articles for
+        """
+        self._articles_timer = None
+        try:
+            await self.refresh_articles(show_id=show_id)
         except Exception as err:
             log_and_notify(self, err, "Error")
 
@@ -392,6 +413,10 @@ class ttrsscli(App[None]):
                     and selected_item.id.startswith("cat_")
                 ):
                     category_id = int(selected_item.id.replace("cat_", ""))
+                    # Load now rather than after a pending highlight refresh
+                    if self._articles_timer is not None:
+                        self._articles_timer.stop()
+                        self._articles_timer = None
                     await self.refresh_articles(show_id=category_id)
                     self.action_focus_next_pane()
 
@@ -455,12 +480,21 @@ class ttrsscli(App[None]):
         ):
             feed_id = int(self.category_id.replace("feed_", ""))
 
-            # Try to get feed details
-            for category in self.client.get_categories():
-                for feed in self.client.get_feeds(
-                    cat_id=category.id,
-                    unread_only=False,  # type: ignore
-                ):
+            # Try to get feed details, fetching the feeds of all categories
+            # concurrently
+            categories = await asyncio.to_thread(self.client.get_categories)
+            feeds_per_category = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self.client.get_feeds,
+                        cat_id=category.id,  # type: ignore
+                        unread_only=False,
+                    )
+                    for category in categories
+                )
+            )
+            for feeds in feeds_per_category:
+                for feed in feeds:
                     if feed.id == feed_id:  # type: ignore
                         feed_title = feed.title  # type: ignore
                         feed_url = getattr(feed, "feed_url", "")
@@ -511,6 +545,8 @@ class ttrsscli(App[None]):
             )
             return
 
+        # Tracks whether the progress screen is ours to remove
+        progress_shown: bool = False
         try:
             os.environ["READWISE_TOKEN"] = self.configuration.readwise_token
             import readwise  # noqa: PLC0415
@@ -518,6 +554,7 @@ class ttrsscli(App[None]):
 
             # Show a progress indicator during the API call
             self.push_screen(screen="progress")
+            progress_shown = True
 
             # Save to Readwise
             response: tuple[bool, PostResponse] = readwise.save_document(
@@ -526,6 +563,7 @@ class ttrsscli(App[None]):
 
             # Remove progress screen
             self.pop_screen()
+            progress_shown = False
 
             if response[1].url and response[1].id:
                 self.notify(
@@ -544,7 +582,7 @@ class ttrsscli(App[None]):
                 )
         except Exception as err:
             # Make sure to remove progress screen if there's an error
-            if isinstance(self.screen, ProgressScreen):
+            if progress_shown:
                 self.pop_screen()
 
             logger.error(msg=f"Error saving to Readwise: {err}")
@@ -581,8 +619,8 @@ class ttrsscli(App[None]):
         content_view: Widget = self.query_one(selector="#content")
         await content_view.remove()
 
-        logger.debug(msg=f"Content markdown length: {len(self.content_markdown)}")
-        logger.debug(msg=f"Content sample: {self.content_markdown[:100]}")
+        logger.debug("Content markdown length: %d", len(self.content_markdown))
+        logger.debug("Content sample: %s", self.content_markdown[:100])
 
         # Then create and mount a new one
         new_viewer = LinkableMarkdownViewer(
@@ -812,7 +850,9 @@ class ttrsscli(App[None]):
         """
         try:
             # Fetch the full article
-            articles: list[Article] = self.client.get_articles(article_id=article_id)
+            articles: list[Article] = await asyncio.to_thread(
+                self.client.get_articles, article_id=article_id
+            )
         except Exception as err:
             logger.error(msg=f"Error fetching article content: {err}")
             self.notify(
@@ -868,8 +908,10 @@ class ttrsscli(App[None]):
             text=self.current_article_title
         )
 
-        # Get article content
-        self.content_markdown_original: str = render_html_to_markdown(
+        # Get article content, converted in a thread as parsing a long article
+        # would otherwise hold up input and redraws
+        self.content_markdown_original: str = await asyncio.to_thread(
+            render_html_to_markdown,
             html_content=article.content,  # type: ignore
             clean_urls=self.clean_url,
         )
@@ -910,17 +952,72 @@ class ttrsscli(App[None]):
                 severity="error",
             )
 
-        # Mark as read if auto-mark-read is enabled
-        if self.configuration.auto_mark_read:
-            self.client.mark_read(article_id=article_id)
-            await self.refresh_categories()
+        self._prefetch_adjacent_articles(article_id=article_id)
+
+        # Mark as read if auto-mark-read is enabled. Articles that are already
+        # read are skipped, marking them would only invalidate the cached
+        # categories and feeds and refetch counts that haven't changed
+        if self.configuration.auto_mark_read and getattr(article, "unread", True):
+            # The article is already shown, so the server and the unread
+            # counts are updated in the background
+            self.run_worker(
+                partial(self._mark_read_and_refresh, article_id=article_id),
+                name="mark_read",
+                group="mark_read",
+                exit_on_error=False,
+            )
+
+    async def _mark_read_and_refresh(self, article_id: int) -> None:
+        """Mark an article as read and refresh the unread counts.
+
+        Args:
+            article_id: ID of the article to mark as read
+        """
+        await asyncio.to_thread(self.client.mark_read, article_id=article_id)
+        await self.refresh_categories()
+
+    def _prefetch_adjacent_articles(self, article_id: int) -> None:
+        """Fetch the articles before and after the shown one in the background.
+
+        Reading usually continues with j/k, so the next article is then
+        already in the client cache when it is opened.
+
+        Args:
+            article_id: ID of the article being shown
+        """
+        list_view: ListView = self.query_one(selector="#articles", expect_type=ListView)
+        article_ids: list[str] = [
+            item.id
+            for item in list_view.children
+            if item.id is not None and item.id.startswith("art_")
+        ]
+        try:
+            position: int = article_ids.index(f"art_{article_id}")
+        except ValueError:
+            return
+
+        for neighbour in article_ids[max(position - 1, 0) : position + 2]:
+            neighbour_id = int(neighbour.replace("art_", ""))
+            if neighbour_id == article_id or self.client.has_article(
+                article_id=neighbour_id
+            ):
+                continue
+            self.run_worker(
+                partial(self.client.get_articles, article_id=neighbour_id),
+                name="prefetch",
+                group="prefetch",
+                exit_on_error=False,
+                thread=True,
+            )
 
     def action_previous_article(self) -> None:
         """Open previous article."""
         self.last_key = "k"
         list_view: ListView = self.query_one(selector="#articles", expect_type=ListView)
         list_view.focus()
-        if not list_view.index == 0 or (self.group_feeds and list_view.index == 1):
+        # At the top there is nothing to go back to. A feed title above the
+        # first article is skipped by on_list_view_highlighted
+        if list_view.index != 0:
             list_view.action_cursor_up()
 
     def action_previous_category(self) -> None:
@@ -1103,11 +1200,13 @@ class ttrsscli(App[None]):
         else:
             self.push_screen(screen=HelpScreen())
 
-    def action_toggle_read(self) -> None:
+    async def action_toggle_read(self) -> None:
         """Toggle article read/unread status."""
         if hasattr(self, "article_id") and self.article_id:
             try:
-                self.client.toggle_unread(article_id=self.article_id)
+                await asyncio.to_thread(
+                    self.client.toggle_unread, article_id=self.article_id
+                )
                 self.notify(message="Article read status toggled", title="Info")
             except Exception as e:
                 logger.error(msg=f"Error toggling article read status: {e}")
@@ -1135,11 +1234,13 @@ class ttrsscli(App[None]):
         await article_list.clear()
         await self.refresh_categories()
 
-    def action_toggle_star(self) -> None:
+    async def action_toggle_star(self) -> None:
         """Toggle article star status."""
         if hasattr(self, "article_id") and self.article_id:
             try:
-                self.client.toggle_starred(article_id=self.article_id)
+                await asyncio.to_thread(
+                    self.client.toggle_starred, article_id=self.article_id
+                )
                 self.notify(message="Article star status toggled", title="Info")
             except Exception as e:
                 logger.error(msg=f"Error toggling star status: {e}")
@@ -1260,7 +1361,7 @@ class ttrsscli(App[None]):
         Args:
             show_id: ID of category or feed to show articles for
         """
-        article_ids: list[str] = []
+        article_ids: set[str] = set()
 
         view_mode: Literal["all_articles"] | Literal["unread"] = (
             "all_articles" if self.show_special_categories else "unread"
@@ -1283,18 +1384,32 @@ class ttrsscli(App[None]):
             feed_id = show_id
             is_cat = True
 
-        # Clear the article list view
+        self.refresh_generation["articles"] += 1
+        generation: int = self.refresh_generation["articles"]
+
+        # The list keeps showing the previous articles until the new ones are in
         list_view: ListView = self.query_one(selector="#articles", expect_type=ListView)
-        await list_view.clear()
+        rows: list[ListRow] = []
 
         try:
             logger.debug(
-                msg=f"Fetching articles for feed_id={feed_id}, is_cat={is_cat}, view_mode={view_mode}"
+                "Fetching articles for feed_id=%s, is_cat=%s, view_mode=%s",
+                feed_id,
+                is_cat,
+                view_mode,
             )
-            articles: list[Article] = self.client.get_headlines(
-                feed_id=feed_id, is_cat=is_cat, view_mode=view_mode
+            articles: list[Article] = await asyncio.to_thread(
+                self.client.get_headlines,
+                feed_id=feed_id,
+                is_cat=is_cat,
+                view_mode=view_mode,
             )
-            logger.info(msg=f"Retrieved {len(articles) if articles else 0} articles")
+            logger.info("Retrieved %d articles", len(articles) if articles else 0)
+
+            # A newer refresh started while waiting for the server, it owns the list
+            if generation != self.refresh_generation["articles"]:
+                logger.debug("Dropping headlines from an outdated refresh")
+                return
 
             # Sort articles, first by feed title, then by published date (newest first)
             if feed_id != self.RECENTLY_READ_FEED_ID:
@@ -1314,20 +1429,23 @@ class ttrsscli(App[None]):
                     )  # type: ignore
                     feed_title = html.unescape(article.feed_title.strip())  # type: ignore
                     if article_id not in article_ids:
-                        feed_title_item = ListItem(
-                            Static(content=feed_title), id=article_id
+                        rows.append(
+                            ListRow(item_id=article_id, text=feed_title, header=True)
                         )
-                        feed_title_item.styles.color = "white"
-                        feed_title_item.styles.background = "blue"
-                        list_view.append(item=feed_title_item)
-                        article_ids.append(article_id)
+                        article_ids.add(article_id)
 
                 # Add the article to list
                 if article.title != "":  # type: ignore
                     article_id = f"art_{article.id}"  # type: ignore
                     if article_id not in article_ids:
-                        # Style based on read status
-                        style: str = "bold" if article.unread else "none"  # type: ignore
+                        # Style based on read status, articles that have been
+                        # selected before are shown as read
+                        style: str = (
+                            "bold"
+                            if article.unread  # type: ignore
+                            and int(article.id) not in self.selected_article_ids  # type: ignore
+                            else "none"
+                        )
 
                         # Add indicators for special properties
                         if article.note or article.published or article.marked:  # type: ignore
@@ -1346,18 +1464,16 @@ class ttrsscli(App[None]):
                             + escape_markdown_formatting(text=article.title.strip())  # type: ignore
                         )
 
-                        # Create list item
-                        article_title_item = ListItem(
-                            Static(content=article_title), id=article_id
+                        rows.append(
+                            ListRow(
+                                item_id=article_id,
+                                text=article_title,
+                                text_style=style,
+                            )
                         )
-                        article_title_item.styles.text_style = style
-
-                        # Mark item as highlighted if it's been selected before
-                        if int(article.id) in self.selected_article_ids:  # type: ignore
-                            article_title_item.styles.text_style = "none"
+                        article_ids.add(article_id)
 
-                        list_view.append(item=article_title_item)
-                        article_ids.append(article_id)
+            await self._update_list_view(list_view=list_view, rows=rows)
 
             if not articles:
                 await self.action_clear()
@@ -1373,42 +1489,70 @@ class ttrsscli(App[None]):
                 severity="error",
             )
 
-    async def refresh_categories(self) -> None:
+    async def refresh_categories(self) -> None:  # noqa: PLR0912, PLR0915
         """Load categories from TTRSS and filter based on unread-only mode."""
         try:
             logger.info(msg="Starting category refresh...")
-            existing_ids: list[str] = []
+            existing_ids: set[str] = set()
+            self.refresh_generation["categories"] += 1
+            generation: int = self.refresh_generation["categories"]
 
             # Get all categories
             logger.debug(msg="Fetching categories from server...")
-            categories = self.client.get_categories()
+            categories = await asyncio.to_thread(self.client.get_categories)
             logger.info(
                 msg=f"Retrieved {len(categories) if categories else 0} categories"
             )
 
-            # Get ListView for categories and clear it
-            list_view: ListView = self.query_one(
-                selector="#categories", expect_type=ListView
-            )
-            await list_view.clear()
-
             unread_only: bool = False if self.show_special_categories else True
             max_length: int = 0
 
-            if categories:
-                # Sort categories by title
-                sorted_categories = sorted(
-                    categories,
-                    key=lambda x: x.title,  # type: ignore
-                )  # type: ignore
+            # The client returns categories sorted by title
+            sorted_categories = categories or []
+
+            # Fetch the feeds of expanded categories before touching the list,
+            # so it is never left half built while waiting for the server, and
+            # request them concurrently
+            expanded_ids: list[int] = [
+                category.id  # type: ignore
+                for category in sorted_categories
+                if self._is_category_shown(category=category)
+                and self._is_category_expanded(category=category)
+            ]
+            expanded_feeds: dict[int, list] = dict(
+                zip(
+                    expanded_ids,
+                    await asyncio.gather(
+                        *(
+                            asyncio.to_thread(
+                                self.client.get_feeds,
+                                cat_id=cat_id,
+                                unread_only=unread_only,
+                            )
+                            for cat_id in expanded_ids
+                        )
+                    ),
+                    strict=True,
+                )
+            )
+
+            # A newer refresh started while waiting for the server, it owns the list
+            if generation != self.refresh_generation["categories"]:
+                logger.debug(msg="Dropping categories from an outdated refresh")
+                return
 
+            # Get ListView for categories, the rows are compared with the
+            # current ones once they are all built
+            list_view: ListView = self.query_one(
+                selector="#categories", expect_type=ListView
+            )
+            rows: list[ListRow] = []
+            cursor_index: int | None = None
+
+            if sorted_categories:
                 for category in sorted_categories:
                     # Skip categories with no unread articles if unread-only mode is enabled and special categories are hidden
-                    if (
-                        not self.show_special_categories
-                        and self.show_unread_only
-                        and category.unread == 0  # type: ignore
-                    ):
+                    if not self._is_category_shown(category=category):
                         continue
 
                     # category_id is used if expand_category is enabled
@@ -1422,10 +1566,10 @@ class ttrsscli(App[None]):
                                 f" ({category.unread})" if category.unread else ""  # type: ignore
                             )
                             max_length = max(max_length, len(category.title))  # type: ignore
-                            list_view.append(
-                                item=ListItem(
-                                    Static(content=category.title + article_count),  # type: ignore
-                                    id=category_id,
+                            rows.append(
+                                ListRow(
+                                    item_id=category_id,
+                                    text=category.title + article_count,  # type: ignore
                                 )
                             )
                         # Handle normal categories
@@ -1437,51 +1581,39 @@ class ttrsscli(App[None]):
                                 f" ({category.unread})" if category.unread else ""  # type: ignore
                             )
                             max_length = max(max_length, len(category.title))  # type: ignore
-                            list_view.append(
-                                item=ListItem(
-                                    Static(content=category.title + article_count),  # type: ignore
-                                    id=category_id,
+                            rows.append(
+                                ListRow(
+                                    item_id=category_id,
+                                    text=category.title + article_count,  # type: ignore
                                 )
                             )
-                        existing_ids.append(category_id)
+                        existing_ids.add(category_id)
 
                     # Expand category view to show feeds or show special categories (always expanded)
-                    if (
-                        self.expand_category
-                        and self.category_id == category_id
-                        and not self.show_special_categories
-                    ) or (self.show_special_categories and category.title == "Special"):  # type: ignore
-                        feeds = self.client.get_feeds(
-                            cat_id=category.id,  # type: ignore
-                            unread_only=unread_only,
-                        )
-                        for feed in feeds:
+                    if category.id in expanded_feeds:  # type: ignore
+                        for feed in expanded_feeds[category.id]:  # type: ignore
                             feed_id: str = f"feed_{feed.id}"  # type: ignore
                             if feed_id not in existing_ids:
                                 feed_unread_count: str = (
                                     f" ({feed.unread})" if feed.unread else ""  # type: ignore
                                 )
                                 max_length = max(max_length, len(feed.title) + 3)  # type: ignore
-                                list_view.append(
-                                    item=ListItem(
-                                        Static(
-                                            content="  "
-                                            + feed.title  # type: ignore
-                                            + feed_unread_count
-                                        ),
-                                        id=feed_id,
-                                    )
-                                )
-                                existing_ids.append(feed_id)
+                                feed_text: str = "  " + feed.title + feed_unread_count  # type: ignore
+                                rows.append(ListRow(item_id=feed_id, text=feed_text))
+                                existing_ids.add(feed_id)
 
                         # Set cursor position based on last key press
                         if self.show_special_categories and self.last_key == "S":
-                            list_view.index = 1
+                            cursor_index = 1
                             self.last_key = ""
                         elif self.last_key == "R":
-                            list_view.index = 5
+                            cursor_index = 5
                             self.last_key = ""
 
+            await self._update_list_view(list_view=list_view, rows=rows)
+            if cursor_index is not None:
+                list_view.index = cursor_index
+
             # Set category listview width based on longest category name
             estimated_width: int = max(max_length + 5, 15)
             estimated_width = min(estimated_width, 80)
@@ -1498,11 +1630,140 @@ class ttrsscli(App[None]):
                 severity="error",
             )
 
+    async def _update_list_view(self, list_view: ListView, rows: list[ListRow]) -> None:
+        """Make a list view show the given rows, reusing the rows it already has.
+
+        Rows are matched by id. A row that is still wanted only gets its text
+        and text style updated, new rows are inserted in place and the rest
+        are removed, so a refresh that mostly changes unread counts doesn't
+        rebuild the whole list. The highlighted row stays highlighted without
+        a new Highlighted message.
+
+        Args:
+            list_view: List view to update
+            rows: Wanted rows in order
+        """
+        # Refreshes run concurrently, one list update at a time keeps them
+        # from adding the same row twice
+        async with self.list_update_lock:
+            current: dict[str, ListItem] = {
+                item.id: item  # type: ignore
+                for item in list_view.children
+                if item.id is not None
+            }
+            kept_ids: list[str] = [
+                row.item_id for row in rows if row.item_id in current
+            ]
+
+            # Nothing to reuse, a plain rebuild is cheapest
+            if not kept_ids:
+                await self._rebuild_list_view(list_view=list_view, rows=rows)
+                return
+
+            # The prevent stack is shared by every widget, so messages are only
+            # prevented around synchronous index changes and never across an
+            # await, or other lists would lose their Highlighted messages too
+            highlighted: ListItem | None = list_view.highlighted_child
+            wanted: set[str] = set(kept_ids)
+            if highlighted is not None and highlighted.id not in wanted:
+                with list_view.prevent(ListView.Highlighted):
+                    list_view.index = None
+                highlighted = None
+
+            def restore_highlight() -> None:
+                """Point the index back at the row that was highlighted."""
+                if highlighted is None or highlighted not in list_view.children:
+                    return
+                position: int = list_view.children.index(highlighted)
+                if list_view.index != position:
+                    with list_view.prevent(ListView.Highlighted):
+                        list_view.index = position
+
+            # remove_children leaves the index alone, remove_items would move
+            # it and post Highlighted once the removal is done
+            stale: list[Widget] = [
+                item for item in list_view.children if item.id not in wanted
+            ]
+            if stale:
+                await list_view.remove_children(stale)
+                restore_highlight()
+
+            # Rows that moved can't be kept in place, rebuild instead
+            if [item.id for item in list_view.children] != kept_ids:
+                await self._rebuild_list_view(list_view=list_view, rows=rows)
+                return
+
+            pending: list[ListItem] = []
+            for index, row in enumerate(rows):
+                if row.item_id not in current:
+                    pending.append(row.to_list_item())
+                    continue
+                if pending:
+                    await list_view.insert(index=index - len(pending), items=pending)
+                    restore_highlight()
+                    pending = []
+            if pending:
+                await list_view.extend(pending)
+
+            # Text and style updates are drawn together
+            with self.batch_update():
+                for row in rows:
+                    existing: ListItem | None = current.get(row.item_id)
+                    if existing is None:
+                        continue
+                    static: Static = existing.query_one(Static)
+                    if static.content != row.text:
+                        static.update(row.text)
+                    if row.text_style is not None:
+                        existing.styles.text_style = row.text_style
+
+    async def _rebuild_list_view(
+        self, list_view: ListView, rows: list[ListRow]
+    ) -> None:
+        """Replace all rows of a list view.
+
+        Args:
+            list_view: List view to rebuild
+            rows: Rows in order
+        """
+        # clear() resets the index at once, only that part is prevented
+        with list_view.prevent(ListView.Highlighted):
+            await_remove = list_view.clear()
+        await await_remove
+        await list_view.extend(row.to_list_item() for row in rows)
+
+    def _is_category_shown(self, category: Any) -> bool:
+        """Check if a category is listed in the categories pane.
+
+        Args:
+            category: Category from the server
+
+        Returns:
+            False for categories without unread articles in unread-only mode
+        """
+        return not (
+            not self.show_special_categories
+            and self.show_unread_only
+            and category.unread == 0
+        )
+
+    def _is_category_expanded(self, category: Any) -> bool:
+        """Check if the feeds of a category are listed below it.
+
+        Args:
+            category: Category from the server
+
+        Returns:
+            True for the expanded category, or Special in special categories view
+        """
+        if self.show_special_categories:
+            return category.title == "Special"
+        return self.expand_category and self.category_id == f"cat_{category.id}"
+
     def on_unmount(self) -> None:
         """Clean up resources when app is closed."""
-        # Close the HTTP client
-        if hasattr(self, "http_client"):
-            self.http_client.close()
+        # Close the HTTP client shared by the link screens
+        LinkSelectionScreen.close_http_client()
 
     @work
     async def action_mark_all_read(self) -> None:  # noqa: PLR0912
@@ -1520,13 +1781,15 @@ class ttrsscli(App[None]):
 
                 # Try to get feed title
                 try:
-                    feed_props = self.client.get_feed_properties(feed_id=feed_id)
+                    feed_props = await asyncio.to_thread(
+                        self.client.get_feed_properties, feed_id=feed_id
+                    )
                     if feed_props and hasattr(feed_props, "title"):
                         feed_title = feed_props.title
                     else:
                         feed_title = "this feed"
                 except Exception as e:
-                    logger.debug(msg=f"Error getting feed title: {e}")
+                    logger.debug("Error getting feed title: %s", e)
                     feed_title = "this feed"
 
             elif self.category_id.startswith("cat_"):
@@ -1536,7 +1799,7 @@ class ttrsscli(App[None]):
 
                 # Try to get category title
                 try:
-                    categories = self.client.get_categories()
+                    categories = await asyncio.to_thread(self.client.get_categories)
                     for category in categories:
                         if int(category.id) == feed_id:  # type: ignore
                             feed_title = category.title  # type: ignore
@@ -1544,7 +1807,7 @@ class ttrsscli(App[None]):
                     if not feed_title:
                         feed_title = "this category"
                 except Exception as e:
-                    logger.debug(msg=f"Error getting category title: {e}")
+                    logger.debug("Error getting category title: %s", e)
                     feed_title = "this category"
 
         if not feed_id:
@@ -1564,7 +1827,9 @@ class ttrsscli(App[None]):
         if result and result.get("confirm"):
             try:
                 # Mark all as read for the specific feed only
-                success = self.client.mark_all_read(feed_id=feed_id, is_cat=is_cat)
+                success = await asyncio.to_thread(
+                    self.client.mark_all_read, feed_id=feed_id, is_cat=is_cat
+                )
 
                 if success:
                     # Refresh the UI
@@ -3,9 +3,10 @@
 import logging
 from typing import Any
 
-from textual.app import ComposeResult
+from textual import work
+from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
-from textual.screen import ModalScreen
+from textual.screen import ModalScreen, Screen
 from textual.widgets import (
     Button,
     Checkbox,
@@ -22,6 +23,26 @@ from ...ui.screens import ConfirmScreen
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 
+def _toggle_buttons(screen: Screen, buttons: list[Button], disabled: bool) -> None:
+    """Disable or enable buttons while a request is in flight.
+
+    A focused button that gets disabled hands focus to the next widget, so a
+    second enter would press Cancel. Focus is cleared instead and given back
+    when the buttons are enabled again.
+
+    Args:
+        screen: Screen that owns the buttons
+        buttons: Buttons to toggle
+        disabled: Whether to disable the buttons
+    """
+    if disabled and screen.focused in buttons:
+        screen.set_focus(None)
+    for button in buttons:
+        button.disabled = disabled
+    if not disabled and screen.focused is None:
+        buttons[0].focus()
+
+
 class AddFeedScreen(ModalScreen):
     """Modal screen for adding a new feed."""
 
@@ -95,13 +116,17 @@ class AddFeedScreen(ModalScreen):
                 selector="#category-list", expect_type=ListView
             )
 
-            for category in sorted(categories, key=lambda x: x.title):
+            # Categories come sorted by title, mount them in one go
+            items: list[ListItem] = []
+            for category in categories:
                 if category.title != "Special":  # Skip special category
-                    item = ListItem(
-                        Label(renderable=category.title), id=f"cat_{category.id}"
+                    items.append(
+                        ListItem(
+                            Label(renderable=category.title), id=f"cat_{category.id}"
+                        )
                     )
-                    category_list.append(item=item)
                     self.categories.append((category.id, category.title))
+            category_list.extend(items)
 
             # Select the provided category if any
             if self.category_id is not None:
@@ -145,6 +170,10 @@ class AddFeedScreen(ModalScreen):
 
     def action_add_feed(self) -> None:
         """Add a new feed with the provided details."""
+        # Ignore repeated requests while one is in flight
+        if self._loading:
+            return
+
         if not self.feed_url:
             self.notify(
                 message="Please enter a feed URL",
@@ -153,57 +182,78 @@ class AddFeedScreen(ModalScreen):
             )
             return
 
-        try:
-            # Show progress indicator
-            progress_container: Vertical = self.query_one(
-                selector="#progress-container", expect_type=Vertical
-            )
-            progress_container.styles.display = "block"
-            self._loading = True
+        self._set_loading(loading=True)
+        self._subscribe_feed(
+            app=self.app,
+            feed={
+                "feed_url": self.feed_url,
+                "category_id": self.selected_category,
+                "feed_title": self.feed_name if self.feed_name else None,
+                # Authentication, if provided
+                "login": self.login_user if self.login_user else None,
+                "password": self.login_pass if self.login_pass else None,
+            },
+        )
 
-            # Prepare authentication if provided
-            auth_login: str | None = self.login_user if self.login_user else None
-            auth_pass: str | None = self.login_pass if self.login_pass else None
-
-            # Add the feed
-            result = self.client.subscribe_to_feed(
-                feed_url=self.feed_url,
-                category_id=self.selected_category,
-                feed_title=self.feed_name if self.feed_name else None,
-                login=auth_login,
-                password=auth_pass,
-            )
+    def _set_loading(self, loading: bool) -> None:
+        """Show or hide the progress indicator and toggle the add button.
 
-            # Hide progress indicator
-            progress_container.styles.display = "none"
-            self._loading = False
+        Args:
+            loading: Whether a request is in flight
+        """
+        self._loading = loading
+        progress_container: Vertical = self.query_one(
+            selector="#progress-container", expect_type=Vertical
+        )
+        progress_container.styles.display = "block" if loading else "none"
+        _toggle_buttons(
+            screen=self,
+            buttons=[self.query_one(selector="#add-button", expect_type=Button)],
+            disabled=loading,
+        )
 
-            if result and hasattr(result, "status") and result.status:
-                self.notify(message="Feed added successfully", title="Success")
-                self.dismiss(result=True)
-            else:
-                error_msg = (
-                    getattr(result, "message", "Unknown error")
-                    if result
-                    else "Unknown error"
-                )
-                self.notify(
-                    message=f"Failed to add feed: {error_msg}",
-                    title="Error",
-                    severity="error",
-                )
-        except Exception as e:
-            # Hide progress indicator if there's an error
-            if self._loading:
-                progress_container = self.query_one(
-                    selector="#progress-container", expect_type=Vertical
-                )
-                progress_container.styles.display = "none"
-                self._loading = False
+    @work(thread=True, exclusive=True, group="feed")
+    def _subscribe_feed(self, app: App, feed: dict[str, Any]) -> None:
+        """Subscribe to the feed from a worker thread.
+
+        Args:
+            app: The running app
+            feed: Arguments for subscribe_to_feed
+        """
+        try:
+            result = self.client.subscribe_to_feed(**feed)
+        except Exception as err:
+            app.call_from_thread(self._on_feed_added, None, err)
+            return
 
-            logger.error(msg=f"Error adding feed: {e}")
+        app.call_from_thread(self._on_feed_added, result, None)
+
+    def _on_feed_added(self, result: Any, error: Exception | None) -> None:
+        """Report the subscribe result back on the UI thread.
+
+        Args:
+            result: Result from the server, None on error
+            error: Exception raised by the API call, if any
+        """
+        self._set_loading(loading=False)
+
+        if error is not None:
+            error_msg = f"Error adding feed: {error}"
+            logger.error("%s", error_msg)
+            self.notify(message=error_msg, title="Error", severity="error")
+        elif result and hasattr(result, "status") and result.status:
+            self.notify(message="Feed added successfully", title="Success")
+            self.dismiss(result=True)
+        else:
+            error_msg = (
+                getattr(result, "message", "Unknown error")
+                if result
+                else "Unknown error"
+            )
             self.notify(
-                message=f"Error adding feed: {e}", title="Error", severity="error"
+                message=f"Failed to add feed: {error_msg}",
+                title="Error",
+                severity="error",
             )
 
     def action_close_screen(self) -> None:
@@ -303,13 +353,17 @@ class EditFeedScreen(ModalScreen):
                 selector="#category-list", expect_type=ListView
             )
 
-            for category in sorted(categories, key=lambda x: x.title):
+            # Categories come sorted by title, mount them in one go
+            items: list[ListItem] = []
+            for category in categories:
                 if category.title != "Special":  # Skip special category
-                    item = ListItem(
-                        Label(renderable=category.title), id=f"cat_{category.id}"
+                    items.append(
+                        ListItem(
+                            Label(renderable=category.title), id=f"cat_{category.id}"
+                        )
                     )
-                    category_list.append(item=item)
                     self.categories.append((category.id, category.title))  # type: ignore
+            category_list.extend(items)
 
             # Fetch feed details using get_feed_properties with additional error handling
             try:
@@ -357,7 +411,9 @@ class EditFeedScreen(ModalScreen):
                             all_feeds.extend(feeds)
                         except Exception as feed_err:
                             logger.warning(
-                                msg=f"Error getting feeds for category {category.id}: {feed_err}"
+                                "Error getting feeds for category %s: %s",
+                                category.id,
+                                feed_err,
                             )
 
                     # Find the feed in all_feeds
@@ -373,7 +429,7 @@ class EditFeedScreen(ModalScreen):
                                 url_input.value = self.current_url
                             break
             except Exception as feed_error:
-                logger.error(msg=f"Error fetching feed details: {feed_error}")
+                logger.error("Error fetching feed details: %s", feed_error)
                 self.notify(
                     title="Warning",
                     message="Could not fetch complete feed details. Some settings may not be available.",
@@ -472,12 +528,9 @@ class EditFeedScreen(ModalScreen):
                 progress_container.styles.display = "none"
                 self._loading = False
 
-            logger.error(f"Error loading feed details: {e}")
-            self.notify(
-                title="Error",
-                message=f"Failed to load feed details: {e}",
-                severity="error",
-            )
+            error_msg = f"Failed to load feed details: {e}"
+            logger.error("%s", error_msg)
+            self.notify(title="Error", message=error_msg, severity="error")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -500,12 +553,11 @@ class EditFeedScreen(ModalScreen):
 
     def action_save_feed(self) -> None:
         """Save the feed with updated properties."""
-        try:
-            # Show progress indicator
-            progress_container = self.query_one("#progress-container", Vertical)
-            progress_container.styles.display = "block"
-            self._loading = True
+        # Ignore repeated requests while one is in flight
+        if self._loading:
+            return
 
+        try:
             # Collect settings from checkboxes
             settings = {}
             for setting_id in [
@@ -516,38 +568,81 @@ class EditFeedScreen(ModalScreen):
             ]:
                 checkbox = self.query_one(f"#checkbox-{setting_id}", Checkbox)
                 settings[setting_id.replace("-", "_")] = checkbox.value
+        except Exception as e:
+            error_msg = f"Error updating feed: {e}"
+            logger.error("%s", error_msg)
+            self.notify(message=error_msg, title="Error", severity="error")
+            return
+
+        self._set_loading(loading=True)
+        self._update_feed(
+            app=self.app,
+            title=self.feed_title,
+            category_id=self.selected_category,
+            settings=settings,
+        )
+
+    def _set_loading(self, loading: bool) -> None:
+        """Show or hide the progress indicator and toggle the action buttons.
+
+        Args:
+            loading: Whether a request is in flight
+        """
+        self._loading = loading
+        progress_container = self.query_one("#progress-container", Vertical)
+        progress_container.styles.display = "block" if loading else "none"
+        _toggle_buttons(
+            screen=self,
+            buttons=list(self.query("#save-button, #delete-button").results(Button)),
+            disabled=loading,
+        )
+
+    @work(thread=True, exclusive=True, group="feed")
+    def _update_feed(
+        self, app: App, title: str, category_id: Any, settings: dict[str, bool]
+    ) -> None:
+        """Update the feed properties from a worker thread.
 
-            # Update the feed
+        Args:
+            app: The running app
+            title: New feed title
+            category_id: Category to move the feed to
+            settings: Feed settings keyed by property name
+        """
+        try:
             result = self.client.update_feed_properties(
                 feed_id=self.feed_id,
-                title=self.feed_title,
-                category_id=self.selected_category,
+                title=title,
+                category_id=category_id,
                 **settings,
             )
+        except Exception as err:
+            app.call_from_thread(self._on_feed_saved, None, err)
+            return
 
-            # Hide progress indicator
-            progress_container.styles.display = "none"
-            self._loading = False
+        app.call_from_thread(self._on_feed_saved, result, None)
 
-            if result and getattr(result, "status", False):
-                self.notify(message="Feed updated successfully", title="Success")
-                self.dismiss(result=True)
-            else:
-                self.notify(
-                    message=f"Failed to update feed: {getattr(result, 'message', 'Unknown error')}",
-                    title="Error",
-                    severity="error",
-                )
-        except Exception as e:
-            # Hide progress indicator if there's an error
-            if self._loading:
-                progress_container = self.query_one("#progress-container", Vertical)
-                progress_container.styles.display = "none"
-                self._loading = False
+    def _on_feed_saved(self, result: Any, error: Exception | None) -> None:
+        """Report the update result back on the UI thread.
 
-            logger.error(msg=f"Error updating feed: {e}")
+        Args:
+            result: Result from the server, None on error
+            error: Exception raised by the API call, if any
+        """
+        self._set_loading(loading=False)
+
+        if error is not None:
+            error_msg = f"Error updating feed: {error}"
+            logger.error("%s", error_msg)
+            self.notify(message=error_msg, title="Error", severity="error")
+        elif result and getattr(result, "status", False):
+            self.notify(message="Feed updated successfully", title="Success")
+            self.dismiss(result=True)
+        else:
             self.notify(
-                message=f"Error updating feed: {e}", title="Error", severity="error"
+                message=f"Failed to update feed: {getattr(result, 'message', 'Unknown error')}",
+                title="Error",
+                severity="error",
             )
 
     def action_confirm_delete(self) -> None:
@@ -564,38 +659,49 @@ class EditFeedScreen(ModalScreen):
 
     def delete_feed(self) -> None:
         """Delete the feed after confirmation."""
-        try:
-            # Show progress indicator
-            progress_container = self.query_one("#progress-container", Vertical)
-            progress_container.styles.display = "block"
-            self._loading = True
+        # Ignore repeated requests while one is in flight
+        if self._loading:
+            return
 
-            # Delete the feed
+        self._set_loading(loading=True)
+        self._unsubscribe_feed(app=self.app)
+
+    @work(thread=True, exclusive=True, group="feed")
+    def _unsubscribe_feed(self, app: App) -> None:
+        """Unsubscribe from the feed from a worker thread.
+
+        Args:
+            app: The running app
+        """
+        try:
             result = self.client.unsubscribe_feed(feed_id=self.feed_id)
+        except Exception as err:
+            app.call_from_thread(self._on_feed_deleted, None, err)
+            return
 
-            # Hide progress indicator
-            progress_container.styles.display = "none"
-            self._loading = False
+        app.call_from_thread(self._on_feed_deleted, result, None)
 
-            if result and getattr(result, "status", False):
-                self.notify(message="Feed deleted successfully", title="Success")
-                self.dismiss(result={"action": "deleted", "feed_id": self.feed_id})
-            else:
-                self.notify(
-                    message=f"Failed to delete feed: {getattr(result, 'message', 'Unknown error')}",
-                    title="Error",
-                    severity="error",
-                )
-        except Exception as e:
-            # Hide progress indicator if there's an error
-            if self._loading:
-                progress_container = self.query_one("#progress-container", Vertical)
-                progress_container.styles.display = "none"
-                self._loading = False
+    def _on_feed_deleted(self, result: Any, error: Exception | None) -> None:
+        """Report the unsubscribe result back on the UI thread.
 
-            logger.error(msg=f"Error deleting feed: {e}")
+        Args:
+            result: Result from the server, None on error
+            error: Exception raised by the API call, if any
+        """
+        self._set_loading(loading=False)
+
+        if error is not None:
+            error_msg = f"Error deleting feed: {error}"
+            logger.error("%s", error_msg)
+            self.notify(message=error_msg, title="Error", severity="error")
+        elif result and getattr(result, "status", False):
+            self.notify(message="Feed deleted successfully", title="Success")
+            self.dismiss(result={"action": "deleted", "feed_id": self.feed_id})
+        else:
             self.notify(
-                message=f"Error deleting feed: {e}", title="Error", severity="error"
+                message=f"Failed to delete feed: {getattr(result, 'message', 'Unknown error')}",
+                title="Error",
+                severity="error",
             )
 
     def action_close_screen(self) -> None:
@@ -3,19 +3,28 @@
 import logging
 import os
 import webbrowser
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import ParseResult, urlparse
 
-import httpx
-from textual.app import ComposeResult
+from textual.app import App, ComposeResult
 from textual.screen import ModalScreen
 from textual.widgets import Label, ListItem, ListView
 
 # Readwise imports are handled conditionally in functions due to environment variable requirements
+if TYPE_CHECKING:
+    import httpx
+    from readwise.model import PostResponse
 
 logger = logging.getLogger(name=__name__)
 
+# Maximum width of a title or URL line in the link list
+MAX_LINE_LENGTH: int = 80
+
+# Read downloads in large chunks to keep per-chunk Python overhead low
+DOWNLOAD_CHUNK_SIZE: int = 1024 * 1024
+
 
 class LinkSelectionScreen(ModalScreen):
     """Modal screen to show extracted links and allow selection."""
@@ -25,6 +34,9 @@ class LinkSelectionScreen(ModalScreen):
         ("enter", "select", "Select"),
     ]
 
+    # Shared by all instances so connections are reused between downloads
+    _http_client: ClassVar["httpx.Client | None"] = None
+
     def __init__(self, configuration, links, open_links="browser", open=False) -> None:
         """Initialize the link selection screen.
 
@@ -35,12 +47,42 @@ class LinkSelectionScreen(ModalScreen):
             open: Whether to open the link after saving to Readwise
         """
         super().__init__()
-        self.links: Any = links or []  # Ensure links is never None
+        # Normalize once so later lookups don't need None checks, an empty
+        # URL is kept as "" so selections without a URL are still rejected
+        self.links: tuple[tuple[str, str], ...] = tuple(
+            (title or "No title", url or "") for title, url in links or ()
+        )
         self.open_links: str = open_links
         self.open: bool = open
         self.configuration: Any = configuration
         self.selected_index = 0
-        self.http_client = httpx.Client(follow_redirects=True)
+        # Format each link once, the strings are reused for items and width
+        self.formatted_links: list[str] = [
+            self._format_link_item(link=link) for link in self.links
+        ]
+
+    @classmethod
+    def _get_http_client(cls) -> "httpx.Client":
+        """Return the shared HTTP client, creating it on first use.
+
+        Returns:
+            The httpx client used for downloads
+        """
+        if cls._http_client is None:
+            import httpx  # noqa: PLC0415
+
+            cls._http_client = httpx.Client(
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return cls._http_client
+
+    @classmethod
+    def close_http_client(cls) -> None:
+        """Close the shared HTTP client if it has been created."""
+        if cls._http_client is not None:
+            cls._http_client.close()
+            cls._http_client = None
 
     def compose(self) -> ComposeResult:
         """Define the content layout of the link selection screen."""
@@ -60,35 +102,32 @@ class LinkSelectionScreen(ModalScreen):
             yield Label(renderable="No links found in article")
             return
 
-        # Create a list view with all links
-        link_select = ListView(
-            *[
-                ListItem(Label(renderable=self._format_link_item(link=link)))
-                for link in self.links
-            ],
-            id="link-list",
-        )
+        # List items are added in on_mount so a recompose doesn't rebuild them
+        link_select = ListView(id="link-list")
 
         # Calculate width based on longest link
-        longest_link: int = (
-            max(len(self._format_link_item(link)) for link in self.links)
-            if self.links
-            else 40
-        )
+        longest_link: int = max(map(len, self.formatted_links))
 
         link_select.styles.align_horizontal = "left"
         link_select.styles.width = min(longest_link + 6, 120)
         link_select.styles.max_width = "100%"
         yield link_select
 
-    def on_mount(self) -> None:
-        """Set focus to the list view when screen is mounted."""
+    async def on_mount(self) -> None:
+        """Fill the list view and set focus to it when screen is mounted."""
+        if not self.links:
+            return
+
         link_list: ListView = self.query_one(
             selector="#link-list", expect_type=ListView
         )
+        await link_list.extend(
+            ListItem(Label(renderable=text)) for text in self.formatted_links
+        )
+        link_list.index = 0
         link_list.focus()
 
-    def _format_link_item(self, link: tuple) -> str:
+    def _format_link_item(self, link: tuple[str, str]) -> str:
         """Format a link for display in the list.
 
         Args:
@@ -98,36 +137,34 @@ class LinkSelectionScreen(ModalScreen):
             Formatted link string
         """
         title, url = link
-
-        # Ensure neither value is None
-        title = title or "No title"
         url = url or "No URL"
 
         # Truncate long titles and URLs for better display
-        max_line_length = 80
-
-        if len(title) > max_line_length:
-            title = title[: max_line_length - 3] + "..."
-
-        if len(url) > max_line_length:
-            # Try to keep the domain and part of the path
-            try:
-                parsed: ParseResult = urlparse(url=url)
-                domain: str = parsed.netloc
-                path: str = parsed.path
-
-                if len(domain) + 10 >= max_line_length:  # If domain itself is very long
-                    url: str = domain[: max_line_length - 3] + "..."
-                else:
-                    # Keep domain and truncate path
-                    path_max: int = max_line_length - len(domain) - 10
-                    path_truncated: str = (
-                        path[:path_max] + "..." if len(path) > path_max else path
-                    )
-                    url = f"{domain}{path_truncated}"
-            except Exception:
-                # Fall back to simple truncation if URL parsing fails
-                url = url[: max_line_length - 3] + "..."
+        if len(title) > MAX_LINE_LENGTH:
+            title = title[: MAX_LINE_LENGTH - 3] + "..."
+
+        # Short URLs are shown as-is, only long ones need to be parsed
+        if len(url) <= MAX_LINE_LENGTH:
+            return f"{title}\n{url}"
+
+        # Try to keep the domain and part of the path
+        try:
+            parsed: ParseResult = urlparse(url=url)
+            domain: str = parsed.netloc
+            path: str = parsed.path
+
+            if len(domain) + 10 >= MAX_LINE_LENGTH:  # If domain itself is very long
+                url = domain[: MAX_LINE_LENGTH - 3] + "..."
+            else:
+                # Keep domain and truncate path
+                path_max: int = MAX_LINE_LENGTH - len(domain) - 10
+                path_truncated: str = (
+                    path[:path_max] + "..." if len(path) > path_max else path
+                )
+                url = f"{domain}{path_truncated}"
+        except Exception:
+            # Fall back to simple truncation if URL parsing fails
+            url = url[: MAX_LINE_LENGTH - 3] + "..."
 
         return f"{title}\n{url}"
 
@@ -223,6 +260,8 @@ class LinkSelectionScreen(ModalScreen):
         Args:
             link: URL to download
         """
+        import httpx  # noqa: PLC0415
+
         try:
             # Extract filename from URL
             filename: str = Path(urlparse(url=link).path).name
@@ -232,11 +271,23 @@ class LinkSelectionScreen(ModalScreen):
             # Download the file
             download_path = self.configuration.download_folder / filename
 
-            with self.http_client.stream(method="GET", url=link) as response:
+            http_client: httpx.Client = self._get_http_client()
+            with http_client.stream(method="GET", url=link) as response:
                 response.raise_for_status()
-                with open(file=download_path, mode="wb") as f:
-                    for chunk in response.iter_bytes():
-                        f.write(chunk)
+                # Write straight to the file descriptor, the chunks are already
+                # large so an extra layer of buffering only adds copies
+                fd: int = os.open(
+                    download_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+                try:
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view) :]
+                finally:
+                    os.close(fd)
 
             self.notify(
                 title="Downloaded",
@@ -263,49 +314,89 @@ class LinkSelectionScreen(ModalScreen):
     def _save_to_readwise(self, link: str) -> None:
         """Save the selected link to Readwise.
 
+        The API call runs in a thread worker owned by the app so the UI keeps
+        responding and the worker outlives this screen, which is popped as
+        soon as a link has been processed.
+
         Args:
             link: URL to save
         """
         try:
             os.environ["READWISE_TOKEN"] = self.configuration.readwise_token
+            app = self.app
+            app.run_worker(
+                partial(self._save_to_readwise_worker, app=app, link=link),
+                name="readwise",
+                group="readwise",
+                exit_on_error=False,
+                thread=True,
+            )
+        except Exception as err:
+            logger.error(msg=f"Error saving to Readwise: {err}")
+            self.notify(
+                title="Readwise",
+                message=f"Error: {err!s}",
+                timeout=5,
+                severity="error",
+            )
 
+    def _save_to_readwise_worker(self, app: App, link: str) -> None:
+        """Call the Readwise API from a worker thread.
+
+        Args:
+            app: The running app
+            link: URL to save
+        """
+        # Show a progress indicator during the API call
+        app.call_from_thread(app.push_screen, "progress")
+
+        try:
             # Import readwise only when needed, after setting environment variable
             import readwise  # noqa: PLC0415
-            from readwise.model import PostResponse  # noqa: PLC0415
 
-            # Show a progress indicator during the API call
-            self.app.push_screen(screen="progress")
+            response = readwise.save_document(url=link)
+        except Exception as err:
+            app.call_from_thread(self._on_readwise_done, app, None, err)
+            return
 
-            # Save to Readwise
-            response: tuple[bool, PostResponse] = readwise.save_document(url=link)
+        app.call_from_thread(self._on_readwise_done, app, response, None)
 
-            # Remove progress screen
-            self.app.pop_screen()
+    def _on_readwise_done(
+        self,
+        app: App,
+        response: "tuple[bool, PostResponse] | None",
+        error: Exception | None,
+    ) -> None:
+        """Report the Readwise result back on the UI thread.
 
-            if response[1].url and response[1].id:
-                self.notify(
-                    title="Readwise",
-                    message="Link saved to Readwise.",
-                    timeout=5,
-                )
-                if self.open:
-                    webbrowser.open(url=response[1].url)
-            else:
-                self.notify(
-                    title="Readwise",
-                    message="Error saving link to Readwise.",
-                    timeout=5,
-                    severity="error",
-                )
-        except Exception as err:
-            # Make sure to remove progress screen if there's an error
-            if isinstance(self.screen, "ProgressScreen"):  # type: ignore
-                self.app.pop_screen()
+        Args:
+            app: The running app
+            response: Response from Readwise, None on error
+            error: Exception raised by the API call, if any
+        """
+        # Remove progress screen
+        app.pop_screen()
 
-            logger.error(msg=f"Error saving to Readwise: {err}")
-            self.notify(
+        if error is not None or response is None:
+            logger.error(msg=f"Error saving to Readwise: {error}")
+            app.notify(
                 title="Readwise",
-                message=f"Error: {err!s}",
+                message=f"Error: {error!s}",
+                timeout=5,
+                severity="error",
+            )
+        elif response[1].url and response[1].id:
+            app.notify(
+                title="Readwise",
+                message="Link saved to Readwise.",
+                timeout=5,
+            )
+            if self.open:
+                webbrowser.open(url=response[1].url)
+        else:
+            app.notify(
+                title="Readwise",
+                message="Error saving link to Readwise.",
                 timeout=5,
                 severity="error",
             )
@@ -1,10 +1,16 @@
 """Search screen for ttrsscli."""
 
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, Input, Label
 
+# Delay before a typed value is taken as the search term
+SEARCH_DEBOUNCE_SECONDS: float = 0.12
+
 
 class SearchScreen(ModalScreen):
     """Modal screen for searching articles."""
@@ -18,6 +24,7 @@ class SearchScreen(ModalScreen):
         """Initialize the search screen."""
         super().__init__()
         self.search_term: str = ""
+        self._debounce_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Define the content layout of the search screen."""
@@ -36,11 +43,31 @@ class SearchScreen(ModalScreen):
             self.action_close_screen()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Update search term when input changes."""
-        self.search_term = event.value
+        """Update search term shortly after the user stops typing."""
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        self._debounce_timer = self.set_timer(
+            SEARCH_DEBOUNCE_SECONDS, partial(self._set_search_term, event.value)
+        )
+
+    def _set_search_term(self, value: str) -> None:
+        """Store the search term once input has settled.
+
+        Args:
+            value: Current value of the search input
+        """
+        self._debounce_timer = None
+        self.search_term = value
 
     def action_search(self) -> None:
         """Search for articles with the current search term."""
+        # Pick up anything typed since the last debounce tick
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._set_search_term(
+                value=self.query_one(selector="#search-input", expect_type=Input).value
+            )
+
         if self.search_term:
             self.dismiss(result=self.search_term)
         else:
@@ -1,9 +1,10 @@
 """Custom widgets for ttrsscli."""
 
 import webbrowser
+from typing import NamedTuple
 
 from textual import on
-from textual.widgets import Markdown, MarkdownViewer
+from textual.widgets import ListItem, Markdown, MarkdownViewer, Static
 
 # Shared constants
 ALLOW_IN_FULL_SCREEN: list[str] = [
@@ -22,14 +23,6 @@ ALLOW_IN_FULL_SCREEN: list[str] = [
 class LinkableMarkdownViewer(MarkdownViewer):
     """An extended MarkdownViewer that allows web links to be clicked."""
 
-    def __init__(self, **kwargs) -> None:
-        """Initialize the LinkableMarkdownViewer.
-
-        Args:
-            **kwargs: Additional arguments
-        """
-        super().__init__(**kwargs)
-
     @on(message_type=Markdown.LinkClicked)
     def handle_link(self, event: Markdown.LinkClicked) -> None:
         """Open links in the default web browser.
@@ -40,3 +33,26 @@ class LinkableMarkdownViewer(MarkdownViewer):
         if event.href:
             event.prevent_default()
             webbrowser.open(url=event.href)
+
+
+class ListRow(NamedTuple):
+    """A row wanted in a list view, a ListItem is only built if it is new."""
+
+    item_id: str
+    text: str
+    text_style: str | None = None
+    header: bool = False
+
+    def to_list_item(self) -> ListItem:
+        """Build the list item for this row.
+
+        Returns:
+            ListItem holding the row text, styled as a header if it is one
+        """
+        item = ListItem(Static(content=self.text), id=self.item_id)
+        if self.header:
+            item.styles.color = "white"
+            item.styles.background = "blue"
+        if self.text_style is not None:
+            item.styles.text_style = self.text_style
+        return item
@@ -2,14 +2,36 @@
 
 import functools
 import logging
+import random
 from collections.abc import Callable
-from time import sleep
+from time import monotonic, sleep
 from typing import Any
 
 from ttrss.exceptions import TTRNotLoggedIn
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Delay before the first retry after a connection reset, doubled for each
+# further retry, plus up to RETRY_JITTER seconds so callers don't retry in step
+RETRY_BASE_DELAY: float = 0.05
+RETRY_JITTER: float = 0.05
+
+
+def _relogin(client: Any, attempt_started: float) -> bool:
+    """Log in again unless another call already did so during this attempt.
+
+    Args:
+        client: The client whose method failed
+        attempt_started: monotonic() time when the failed call was made
+
+    Returns:
+        True if the client has a fresh session, False otherwise
+    """
+    if getattr(client, "last_login", 0.0) > attempt_started:
+        logger.debug("Session was renewed by another call, skipping login")
+        return True
+    return client.login()
+
 
 def handle_session_expiration(api_method: Callable) -> Callable:
     """Decorator that retries a function call after re-authenticating if session expires.
@@ -27,17 +49,22 @@ def handle_session_expiration(api_method: Callable) -> Callable:
         retry_count = 0
 
         while retry_count < max_retries:
+            attempt_started: float = monotonic()
             try:
                 return api_method(self, *args, **kwargs)
             except ConnectionResetError as err:
                 logger.warning(
                     msg=f"Connection reset: {err}. Retrying ({retry_count + 1}/{max_retries})..."
                 )
+                # Exponential backoff with jitter
+                sleep(
+                    RETRY_BASE_DELAY * 2**retry_count
+                    + random.uniform(a=0, b=RETRY_JITTER)
+                )
                 retry_count += 1
-                sleep(1)
 
                 # Re-login
-                if not self.login():
+                if not _relogin(client=self, attempt_started=attempt_started):
                     logger.error(msg="Re-authentication failed after connection reset")
                     raise RuntimeError("Re-authentication failed") from err
             except Exception as err:
@@ -68,7 +95,7 @@ def handle_session_expiration(api_method: Callable) -> Callable:
                     retry_count += 1
 
                     # Re-login
-                    if not self.login():
+                    if not _relogin(client=self, attempt_started=attempt_started):
                         logger.error(
                             msg="Re-authentication failed after session expiration"
                         )
@@ -1,19 +1,92 @@
 """HTML to Markdown conversion utilities for ttrsscli."""
 
+import hashlib
+import html
 import logging
 import re
+import threading
+from functools import cache
+from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify
-
+from ..cache import LimitedSizeDict
 from .url import get_clean_url
 
+# bs4 and markdownify are imported on first conversion, they add noticeably
+# to startup and aren't needed until an article is shown
+if TYPE_CHECKING:
+    from markdownify import MarkdownConverter
+
+# The stdlib parser is always available, so output doesn't depend on which
+# optional tree builders happen to be installed
+_HTML_PARSER: str = "html.parser"
+
 logger: logging.Logger = logging.getLogger(name=__name__)
 
+# Rendered markdown keyed by a digest of the HTML and the clean_urls flag,
+# least recently used first. Articles are rendered in worker threads, so the
+# cache is only touched while holding the lock
+_markdown_cache: LimitedSizeDict = LimitedSizeDict(max_size=256)
+_markdown_cache_lock: threading.Lock = threading.Lock()
+
+# An <img> tag and the attributes inside a tag (name, then the value as
+# double quoted, single quoted or bare)
+_IMG_TAG_RE: re.Pattern[str] = re.compile(
+    pattern=r"""<img\b(?:[^>"']|"[^"]*"|'[^']*')*>""", flags=re.IGNORECASE
+)
+_TAG_ATTR_RE: re.Pattern[str] = re.compile(
+    pattern=r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?"""
+)
+
+# Markup that can't contain links (comments, CDATA sections, scripts and
+# styles), the start of such markup when it isn't closed, or an <a> element
+# with its attributes and inner HTML. Link text ends at the closing tag, or
+# at the next <a> or the end of the text when the link isn't closed, in
+# which case "close" doesn't match
+_LINK_SCAN_RE: re.Pattern[str] = re.compile(
+    pattern=r"""<!--.*?-->"""
+    r"""|<!\[CDATA\[.*?\]\]>"""
+    r"""|<(?P<raw>script|style)\b.*?</(?P=raw)\s*>"""
+    r"""|(?P<unclosed><!--|<!\[CDATA\[|<(?:script|style)\b)"""
+    r"""|<a\b(?P<attrs>(?:[^>"']|"[^"]*"|'[^']*')*)>(?P<text>.*?)"""
+    r"""(?:(?P<close></a\s*>)|(?=<a\b)|\Z)""",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+# A tag or processing instruction, with quoted attribute values that may
+# contain ">", and the start of any markup that is left after removing them
+_TAG_RE: re.Pattern[str] = re.compile(
+    pattern=r"""</?[a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>|<\?[^>]*>"""
+)
+_MARKUP_START_RE: re.Pattern[str] = re.compile(pattern=r"<[a-zA-Z/!?]")
+_TAG_NAME_RE: re.Pattern[str] = re.compile(pattern=r"<(/?)([a-zA-Z][a-zA-Z0-9]*)")
+
+# Markup in link text that the scan can't delimit: comments, CDATA sections
+# and other declarations, scripts and styles
+_UNSCANNABLE_TEXT_RE: re.Pattern[str] = re.compile(
+    pattern=r"<(?:!|script\b|style\b)", flags=re.IGNORECASE
+)
+
+# Patterns used by _clean_markdown, in the order they are applied
+_BLANK_LINES_RE: re.Pattern[str] = re.compile(pattern=r"\n{3,}")
+_FENCE_LANGUAGE_RE: re.Pattern[str] = re.compile(pattern=r"```\s+([a-zA-Z0-9]+)\s*\n")
+_BEFORE_HEADING_RE: re.Pattern[str] = re.compile(pattern=r"([^\n])\n(#{1,6} )")
+_AFTER_HEADING_RE: re.Pattern[str] = re.compile(pattern=r"(#{1,6} .*)\n([^\n])")
+_BEFORE_LIST_RE: re.Pattern[str] = re.compile(pattern=r"([^\n])\n(- |\* |[0-9]+\. )")
+_BEFORE_FENCE_RE: re.Pattern[str] = re.compile(pattern=r"([^\n])\n```")
+_AFTER_FENCE_RE: re.Pattern[str] = re.compile(pattern=r"```\n([^\n])")
+_XML_ENCODING_RE: re.Pattern[str] = re.compile(
+    pattern=r'xml encoding="UTF-8"', flags=re.IGNORECASE
+)
+
+# Square brackets that Textual could interpret as markup
+_SQUARE_BRACKETS_RE: re.Pattern[str] = re.compile(pattern=r"\[([^\]]*)\]")
+
 
 def render_html_to_markdown(html_content: str, clean_urls: bool = True) -> str:
     """Convert HTML to markdown.
 
+    Results are cached by content, so revisiting an article skips parsing
+    and conversion.
+
     Args:
         html_content: HTML content
         clean_urls: Whether to clean URLs in the markdown
@@ -21,21 +94,57 @@ def render_html_to_markdown(html_content: str, clean_urls: bool = True) -> str:
     Returns:
         Markdown text
     """
+    cache_key: tuple[bytes, bool] = (
+        hashlib.blake2b(
+            html_content.encode(errors="surrogatepass"), digest_size=16
+        ).digest(),
+        clean_urls,
+    )
+    with _markdown_cache_lock:
+        markdown_text: str | None = _markdown_cache.get(cache_key)
+        if markdown_text is not None:
+            _markdown_cache.move_to_end(key=cache_key)
+            return markdown_text
+
+    # Convert without holding the lock so other articles can render meanwhile
+    markdown_text = _convert_html_to_markdown(
+        html_content=html_content, clean_urls=clean_urls
+    )
+    with _markdown_cache_lock:
+        _markdown_cache[cache_key] = markdown_text
+
+    return markdown_text
+
+
+def _convert_html_to_markdown(html_content: str, clean_urls: bool) -> str:
+    """Convert HTML to markdown without caching.
+
+    Args:
+        html_content: HTML content
+        clean_urls: Whether to clean URLs in the markdown
+
+    Returns:
+        Markdown text
+    """
+    # Replace images with text descriptions before parsing
+    html_content = _IMG_TAG_RE.sub(repl=_replace_image_tag, string=html_content)
+
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
     # Parse HTML
-    soup = BeautifulSoup(markup=html_content, features="html.parser")
-
-    # Replace images with text descriptions
-    for img in soup.find_all(name="img"):
-        if img.get("src"):  # type: ignore
-            # Create a text placeholder for images
-            img_alt: str = img.get("alt", "No description")  # type: ignore
-            img_placeholder: str = f"[Image: {img_alt}]"
-            img.replace_with(soup.new_string(s=img_placeholder))
-
-    # Clean up any code blocks to ensure proper rendering
-    for pre in soup.find_all(name="pre"):
-        # Extract the code language if available
-        code_tag = pre.find("code")  # type: ignore
+    soup = BeautifulSoup(markup=html_content, features=_HTML_PARSER)
+
+    # Walk the tree once for code blocks and, if they are cleaned, links
+    for tag in soup.find_all(name=["pre", "a"] if clean_urls else "pre"):
+        if tag.name == "a":  # type: ignore
+            # Process links to clean URLs
+            if tag.get("href"):  # type: ignore
+                tag["href"] = get_clean_url(url=tag["href"])  # type: ignore
+            continue
+
+        # Clean up code blocks to ensure proper rendering, extract the code
+        # language if available
+        code_tag = tag.find("code")  # type: ignore
         if code_tag and code_tag.get("class"):  # type: ignore
             classes: str = code_tag.get("class")  # type: ignore
             language = ""
@@ -48,16 +157,11 @@ def render_html_to_markdown(html_content: str, clean_urls: bool = True) -> str:
             if language:
                 # Mark the code block with language
                 code_content: str = code_tag.get_text()  # type: ignore
-                pre.replace_with(soup.new_string(f"```{language}\n{code_content}\n```"))
+                tag.replace_with(soup.new_string(f"```{language}\n{code_content}\n```"))
 
-    # Process links to clean URLs if needed
-    if clean_urls:
-        for a in soup.find_all(name="a"):
-            if a.get("href"):  # type: ignore
-                a["href"] = get_clean_url(url=a["href"])  # type: ignore
-
-    # Convert to markdown
-    markdown_text: str = markdownify(html=str(object=soup))
+    # Convert the parsed tree directly, markdownify would otherwise serialize
+    # and parse the whole document again
+    markdown_text: str = _get_markdown_converter().convert_soup(soup=soup)
 
     # Clean up the markdown
     markdown_text = _clean_markdown(markdown_text=markdown_text)
@@ -65,6 +169,52 @@ def render_html_to_markdown(html_content: str, clean_urls: bool = True) -> str:
     return markdown_text
 
 
+@cache
+def _get_markdown_converter() -> "MarkdownConverter":
+    """Return the markdown converter, creating it on first use.
+
+    Converter options never change, so a single instance is shared.
+
+    Returns:
+        The markdownify converter
+    """
+    from markdownify import MarkdownConverter  # noqa: PLC0415
+
+    return MarkdownConverter()
+
+
+def _replace_image_tag(match: re.Match[str]) -> str:
+    """Replace an <img> tag that has a source with a text placeholder.
+
+    Args:
+        match: Match of a complete <img> tag
+
+    Returns:
+        Escaped placeholder text, or the tag unchanged if it has no source
+    """
+    attributes: dict[str, str] = _parse_attributes(tag=match.group(0)[4:])
+    if not attributes.get("src"):
+        return match.group(0)
+
+    img_alt: str = attributes.get("alt", "No description")
+    return html.escape(f"[Image: {img_alt}]", quote=False)
+
+
+def _parse_attributes(tag: str) -> dict[str, str]:
+    """Parse the attributes of an HTML start tag.
+
+    Args:
+        tag: Attribute part of the tag, after the tag name
+
+    Returns:
+        Dictionary of lowercased attribute names and unescaped values
+    """
+    return {
+        name.lower(): html.unescape(double or single or bare)
+        for name, double, single, bare in _TAG_ATTR_RE.findall(tag)
+    }
+
+
 def _clean_markdown(markdown_text: str) -> str:
     """Clean up markdown text for better readability.
 
@@ -74,42 +224,36 @@ def _clean_markdown(markdown_text: str) -> str:
     Returns:
         Cleaned markdown text
     """
+    # Most passes can only match when a marker is present, and no pass adds
+    # or removes one, so the cheap substring tests below let them be skipped
+    has_code_blocks: bool = "```" in markdown_text
+    has_headings: bool = "# " in markdown_text
+
     # Replace multiple consecutive blank lines with a single one
-    markdown_text = re.sub(pattern=r"\n{3,}", repl="\n\n", string=markdown_text)
+    if "\n\n\n" in markdown_text:
+        markdown_text = _BLANK_LINES_RE.sub(repl="\n\n", string=markdown_text)
 
     # Fix code blocks that might have been malformed
-    markdown_text = re.sub(
-        pattern=r"```\s+([a-zA-Z0-9]+)\s*\n", repl=r"```\1\n", string=markdown_text
-    )
+    if has_code_blocks:
+        markdown_text = _FENCE_LANGUAGE_RE.sub(repl=r"```\1\n", string=markdown_text)
 
     # Ensure there are blank lines before and after headings, lists, code blocks
-    markdown_text = re.sub(
-        pattern=r"([^\n])\n(#{1,6} )", repl=r"\1\n\n\2", string=markdown_text
-    )
-    markdown_text = re.sub(
-        pattern=r"(#{1,6} .*)\n([^\n])", repl=r"\1\n\n\2", string=markdown_text
-    )
+    if has_headings:
+        markdown_text = _BEFORE_HEADING_RE.sub(repl=r"\1\n\n\2", string=markdown_text)
+        markdown_text = _AFTER_HEADING_RE.sub(repl=r"\1\n\n\2", string=markdown_text)
 
     # Ensure proper spacing around lists
-    markdown_text = re.sub(
-        pattern=r"([^\n])\n(- |\* |[0-9]+\. )", repl=r"\1\n\n\2", string=markdown_text
-    )
+    markdown_text = _BEFORE_LIST_RE.sub(repl=r"\1\n\n\2", string=markdown_text)
 
     # Ensure proper spacing around code blocks
-    markdown_text = re.sub(
-        pattern=r"([^\n])\n```", repl=r"\1\n\n```", string=markdown_text
-    )
-    markdown_text = re.sub(
-        pattern=r"```\n([^\n])", repl=r"```\n\n\1", string=markdown_text
-    )
+    if has_code_blocks:
+        markdown_text = _BEFORE_FENCE_RE.sub(repl=r"\1\n\n```", string=markdown_text)
+        markdown_text = _AFTER_FENCE_RE.sub(repl=r"```\n\n\1", string=markdown_text)
 
-    # Remove some xmlns attributes that might be present
-    markdown_text = re.sub(
-        pattern=r'xml encoding="UTF-8"',
-        repl="",
-        string=markdown_text,
-        flags=re.IGNORECASE,
-    )
+    # Remove some xmlns attributes that might be present, the marker has no
+    # letters so the test holds for any case
+    if '="' in markdown_text:
+        markdown_text = _XML_ENCODING_RE.sub(repl="", string=markdown_text)
 
     return markdown_text
 
@@ -128,9 +272,7 @@ def escape_markdown_formatting(text: str) -> str:
 
     # Escape other square bracket formatting that Textual might interpret as markup
     # This regex finds square brackets with content inside them
-    text = re.sub(
-        pattern=r"\[([^\]]*)\]", repl=lambda m: f"\\[{m.group(1)}]", string=text
-    )
+    text = _SQUARE_BRACKETS_RE.sub(repl=r"\\[\1]", string=text)
 
     return text
 
@@ -146,18 +288,106 @@ def extract_links(markdown_text: str) -> list[tuple[str, str]]:
     """
     links: list[tuple[str, str]] = []
 
-    # Extract links from article content
-    soup: BeautifulSoup = BeautifulSoup(markup=markdown_text, features="html.parser")
+    # Scan for anchors in one pass instead of building a full HTML tree,
+    # comments and scripts are matched only so that they are skipped
+    for match in _LINK_SCAN_RE.finditer(markdown_text):
+        # An unclosed comment or script hides the rest of the document
+        if match.group("unclosed") is not None:
+            return _extract_links_from_soup(markdown_text=markdown_text)
+
+        attributes: str | None = match.group("attrs")
+        if attributes is None:
+            continue
+
+        # Leave links the scan can't delimit to the parser
+        text: str = match.group("text")
+        if _needs_parser(
+            attributes=attributes, text=text, closed=match.group("close") is not None
+        ):
+            return _extract_links_from_soup(markdown_text=markdown_text)
+
+        # Most link text is plain, only strip tags when there are any
+        if "<" in text:
+            text = _TAG_RE.sub(repl="", string=text)
+            # A tag that couldn't be stripped, e.g. with an unbalanced quote
+            if _MARKUP_START_RE.search(text):
+                return _extract_links_from_soup(markdown_text=markdown_text)
+
+        try:
+            href: str = _parse_attributes(tag=attributes).get("href", "")
+            if href:
+                links.append((html.unescape(text).strip() or href, href))
+        except Exception as e:
+            logger.debug("Error processing link: %s", e)
+
+    return links
+
+
+def _needs_parser(attributes: str, text: str, closed: bool) -> bool:
+    """Check if a scanned link has to be left to the HTML parser.
+
+    Args:
+        attributes: Attribute part of the start tag
+        text: Inner HTML up to where the scan ended the link
+        closed: Whether the link ended at a closing tag
+
+    Returns:
+        True if where the link ends or what its text is depends on parsing
+    """
+    # An unclosed, self-closing or misnested link ends wherever the
+    # surrounding markup makes it end
+    if not closed or attributes.rstrip().endswith("/"):
+        return True
+    if "<" not in text:
+        return False
+    # A comment or script can hide the </a> the scan stopped at
+    if _UNSCANNABLE_TEXT_RE.search(text):
+        return True
+    return "</" in text and not _closes_own_tags(html_text=text)
+
+
+def _closes_own_tags(html_text: str) -> bool:
+    """Check that every closing tag in a fragment closes a tag opened in it.
+
+    Args:
+        html_text: HTML fragment
+
+    Returns:
+        False if the fragment closes an element that was opened before it
+    """
+    open_tags: dict[str, int] = {}
+    for closing, tag_name in _TAG_NAME_RE.findall(html_text):
+        name: str = tag_name.lower()
+        if not closing:
+            open_tags[name] = open_tags.get(name, 0) + 1
+        elif open_tags.get(name):
+            open_tags[name] -= 1
+        else:
+            return False
+    return True
+
+
+def _extract_links_from_soup(markdown_text: str) -> list[tuple[str, str]]:
+    """Extract links by parsing the HTML, for links the scan can't delimit.
+
+    Args:
+        markdown_text: Markdown text
+
+    Returns:
+        List of tuples with link title and URL
+    """
+    from bs4 import BeautifulSoup  # noqa: PLC0415
+
+    links: list[tuple[str, str]] = []
+    soup = BeautifulSoup(markup=markdown_text, features=_HTML_PARSER)
 
     for link in soup.find_all(name="a"):
         try:
             href: str = link.get("href", "")  # type: ignore
             if href:
                 text: str = link.get_text().strip()
-                if not text:
-                    text = href
-                links.append((text, href))
+                links.append((text or href, href))
         except Exception as e:
-            logger.debug(msg=f"Error processing link: {e}")
+            logger.debug("Error processing link: %s", e)
 
     return links
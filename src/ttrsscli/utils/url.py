@@ -1,8 +1,12 @@
 """URL utility functions for ttrsscli."""
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from cleanurl import Result, cleanurl
+# cleanurl loads large language tables, import it on first use
+if TYPE_CHECKING:
+    from cleanurl import Result
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
@@ -21,11 +25,31 @@ def get_clean_url(url: str, clean_url_enabled: bool = True) -> str:
         return ""
 
     if clean_url_enabled:
-        try:
-            cleaned_url: Result | None = cleanurl(url=url, respect_semantics=True)
-            if cleaned_url:
-                return cleaned_url.url
-        except Exception as e:
-            logger.debug(msg=f"Error cleaning URL {url}: {e}")
+        return _clean_url(url=url)
+
+    return url
+
+
+@lru_cache(maxsize=4096)
+def _clean_url(url: str) -> str:
+    """Clean URL using cleanurl.
+
+    Results are memoized, including URLs that can't be cleaned, since
+    articles and feeds tend to repeat the same links.
+
+    Args:
+        url: URL to clean
+
+    Returns:
+        Cleaned URL, or the original URL if cleaning failed
+    """
+    from cleanurl import cleanurl  # noqa: PLC0415
+
+    try:
+        cleaned_url: Result | None = cleanurl(url=url, respect_semantics=True)
+        if cleaned_url:
+            return cleaned_url.url
+    except Exception as e:
+        logger.debug("Error cleaning URL %s: %s", url, e)
 
     return url
@@ -0,0 +1,118 @@
+"""Tests for the HTML to Markdown conversion utilities."""
+
+import warnings
+
+import pytest
+from bs4 import XMLParsedAsHTMLWarning
+
+from ttrsscli.cache import LimitedSizeDict
+from ttrsscli.utils import markdown_converter
+from ttrsscli.utils.markdown_converter import extract_links, render_html_to_markdown
+
+
+@pytest.mark.parametrize(
+    argnames=("html_content", "expected"),
+    argvalues=[
+        # lxml drops the declaration, html.parser keeps it as text
+        (
+            '<?xml version="1.0" encoding="UTF-8"?><p>Hello</p>',
+            'xml version="1.0" encoding="UTF-8"?\n\nHello',
+        ),
+        # lxml closes each <li> and puts it on its own line
+        ("<ul><li>one<li>two</ul>", "* one* two"),
+        # lxml ends the first link at the next <p>
+        (
+            '<p>Read <a href="a">here<p>and <a href="b">there</a></p>',
+            "Read [here\n\nand [there](b)](a)",
+        ),
+    ],
+)
+def test_render_uses_html_parser(html_content: str, expected: str) -> None:
+    """Broken markup renders the same whether or not lxml is installed."""
+    with warnings.catch_warnings():
+        warnings.simplefilter(action="ignore", category=XMLParsedAsHTMLWarning)
+        assert (
+            render_html_to_markdown(html_content=html_content, clean_urls=False)
+            == expected
+        )
+
+
+def test_unclosed_anchors_follow_html_parser() -> None:
+    """An unclosed anchor runs on to the end of the next one, as in html.parser."""
+    html_content = '<p>Read <a href="a">here<p>and <a href="b">there</a></p>'
+    assert extract_links(markdown_text=html_content) == [
+        ("hereand there", "a"),
+        ("there", "b"),
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames=("html_content", "expected"),
+    argvalues=[
+        ('<a href="x">t<!-- </a> --> more</a>', [("t more", "x")]),
+        ('<a href="x">t<script>"</a>"</script>u</a>', [("tu", "x")]),
+        ('<a href="x">t<style>a{}</style>u</a>', [("tu", "x")]),
+        ('<a href="x"/>text</a>', [("x", "x")]),
+        ('<![CDATA[<a href="c">cdata</a>]]><a href="y">y</a>', [("y", "y")]),
+        ('<a href="y">y</a><!-- <a href="x">x</a>', [("y", "y")]),
+        ('<style><a href="x">x</a>', []),
+        ('<a href="y">y</a><![CDATA[<a href="x">x</a>', [("y", "y")]),
+        ('<p><a href="x">foo</p><p>bar <a href="y">y</a>', [("foo", "x"), ("y", "y")]),
+        ('Read more <a href="z">here', [("here", "z")]),
+        ('<p><a href="x">foo</p><p>bar</a></p>', [("foo", "x")]),
+        (
+            '<!-- <a href="no">n</a> --><script>var s="<a href=q>q</a>"</script>'
+            '<a HREF="k">K</A >',
+            [("K", "k")],
+        ),
+        (
+            "<a href=a>1</a> <a href='b' class=c>t<b>w</b>o &amp; x</a>",
+            [("1", "a"), ("two & x", "b")],
+        ),
+    ],
+)
+def test_extract_links_matches_parser(
+    html_content: str, expected: list[tuple[str, str]]
+) -> None:
+    """Links the scan can't delimit give the same result as html.parser."""
+    assert extract_links(markdown_text=html_content) == expected
+
+
+@pytest.mark.parametrize(
+    argnames=("html_content", "expected"),
+    argvalues=[
+        ('<a href="x">x<img alt="a>b">y</a>', [("xy", "x")]),
+        ('<a href="x"><img src="i.png" alt="a>b"></a>', [("x", "x")]),
+        ("<a href=x>a<b title=it's>b</b></a>", [("ab", "x")]),
+        ("<a href=x>a<?pi x>y?>b</a>", [("ay?>b", "x")]),
+        ("<a href=x>a < b &lt;c&gt;</a>", [("a < b <c>", "x")]),
+    ],
+)
+def test_extract_links_title_text(
+    html_content: str, expected: list[tuple[str, str]]
+) -> None:
+    """Link titles are the text html.parser finds inside the link."""
+    assert extract_links(markdown_text=html_content) == expected
+
+
+def test_markdown_cache_evicts_least_recently_used(monkeypatch) -> None:
+    """A cache hit keeps the article from being evicted next."""
+    converted: list[str] = []
+
+    def convert(html_content: str, clean_urls: bool) -> str:
+        converted.append(html_content)
+        return html_content
+
+    monkeypatch.setattr(
+        target=markdown_converter,
+        name="_markdown_cache",
+        value=LimitedSizeDict(max_size=2),
+    )
+    monkeypatch.setattr(
+        target=markdown_converter, name="_convert_html_to_markdown", value=convert
+    )
+
+    for html_content in ("a", "b", "a", "c", "a", "b"):
+        render_html_to_markdown(html_content=html_content, clean_urls=False)
+
+    assert converted == ["a", "b", "c", "b"]